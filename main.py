@@ -4,14 +4,15 @@ import redis.asyncio as redis
 import uvicorn
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from fastapi_limiter import FastAPILimiter
 
 from src.conf.config import settings
-from src.routes.contacts import router as contacts_router
+from src.routes.contacts import router as contacts_router, NEXT_CURSOR_HEADER
 from src.routes.auth import auth_router as auth_router
 from src.routes.users import user_router
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 
 
 # @app.on_event("startup")
@@ -25,6 +26,7 @@ app.add_middleware(
     allow_origins=["*"],
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(contacts_router, tags=["contacts"])
@@ -0,0 +1,24 @@
+"""contacts (user_id, id) index
+
+Revision ID: 3c9a1f27d5e4
+Revises: bf01865be6ba
+Create Date: 2026-10-15 10:12:31.482913
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '3c9a1f27d5e4'
+down_revision = 'bf01865be6ba'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_contacts_user_id_id', 'contacts', ['user_id', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_id', table_name='contacts')
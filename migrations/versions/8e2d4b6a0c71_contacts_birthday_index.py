@@ -0,0 +1,29 @@
+"""contacts birthday (month, day) index
+
+Revision ID: 8e2d4b6a0c71
+Revises: 3c9a1f27d5e4
+Create Date: 2026-10-15 10:41:07.215664
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '8e2d4b6a0c71'
+down_revision = '3c9a1f27d5e4'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_contacts_user_id_birthday',
+        'contacts',
+        ['user_id', sa.text('(EXTRACT(month FROM b_day) * 100 + EXTRACT(day FROM b_day))')],
+        unique=False,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_contacts_user_id_birthday', table_name='contacts')
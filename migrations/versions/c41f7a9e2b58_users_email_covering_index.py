@@ -0,0 +1,32 @@
+"""users email covering index
+
+Revision ID: c41f7a9e2b58
+Revises: 8e2d4b6a0c71
+Create Date: 2026-10-15 11:20:44.903518
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c41f7a9e2b58'
+down_revision = '8e2d4b6a0c71'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        'ix_users_email',
+        'users',
+        ['email'],
+        unique=True,
+        postgresql_include=['id', 'username', 'password', 'avatar', 'is_activated'],
+    )
+    op.drop_constraint('users_email_key', 'users', type_='unique')
+
+
+def downgrade() -> None:
+    op.create_unique_constraint('users_email_key', 'users', ['email'])
+    op.drop_index('ix_users_email', table_name='users')
@@ -5,7 +5,14 @@ from src.conf.config import settings
 # URL = f'postgresql+asyncpg://{user}:{password}@{host}:{port}/{db_name}?async_fallback=True'
 URL = settings.sqlalchemy_database_url
 
-engine = create_async_engine(URL, echo=True)
+engine = create_async_engine(
+    URL,
+    echo=settings.sqlalchemy_echo,
+    pool_size=settings.db_pool_size,
+    max_overflow=settings.db_max_overflow,
+    pool_recycle=settings.db_pool_recycle,
+    pool_pre_ping=True,
+)
 async_session = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
 
 
@@ -1,4 +1,5 @@
-from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, func, MetaData, Boolean
+from sqlalchemy import Column, Integer, String, Date, Text, ForeignKey, DateTime, func, MetaData, Boolean, Index, \
+    extract, literal_column
 from sqlalchemy.orm import declarative_base, relationship
 
 metadata = MetaData()
@@ -16,12 +17,24 @@ class Contact(Base):
     rest_data = Column(Text, nullable=True)
     user_id = Column(Integer, ForeignKey('users.id', ondelete="CASCADE"), nullable=False)
 
+    __table_args__ = (
+        Index('ix_contacts_user_id_id', 'user_id', 'id'),
+        Index('ix_contacts_user_id_birthday', user_id,
+              extract('month', b_day) * literal_column('100') + extract('day', b_day)),
+        Index('ix_contacts_first_name_trgm', 'first_name',
+              postgresql_using='gin', postgresql_ops={'first_name': 'gin_trgm_ops'}),
+        Index('ix_contacts_last_name_trgm', 'last_name',
+              postgresql_using='gin', postgresql_ops={'last_name': 'gin_trgm_ops'}),
+        Index('ix_contacts_email_trgm', 'email',
+              postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
+
 
 class User(Base):
     __tablename__ = 'users'
     id = Column(Integer, primary_key=True, index=True)
     username = Column(String(50))
-    email = Column(String(250), nullable=False, unique=True)
+    email = Column(String(250), nullable=False)
     password = Column(String(255), nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=True)
     avatar = Column(String(255), nullable=True)
@@ -29,3 +42,8 @@ class User(Base):
     reset_token = Column(String(255), nullable=True)
     is_activated = Column(Boolean, default=False, nullable=False)
     contacts = relationship('Contact', backref='user', lazy='dynamic')
+
+    __table_args__ = (
+        Index('ix_users_email', 'email', unique=True,
+              postgresql_include=['id', 'username', 'password', 'avatar', 'is_activated']),
+    )
@@ -9,6 +9,10 @@ database_url = os.environ.get("SQLALCHEMY_DATABASE_URL")
 
 class Settings(BaseSettings):
     sqlalchemy_database_url: str = "postgresql+asyncpg://user:password@$localhost:5432/postgres?async_fallback=True"
+    sqlalchemy_echo: bool = False
+    db_pool_size: int = 20
+    db_max_overflow: int = 10
+    db_pool_recycle: int = 3600
     secret_key: str = 'secret_key'
     algorithm: str = "HS256"
     mail_username: str = "example@email.com"
@@ -1,7 +1,8 @@
 import datetime
+from typing import AsyncIterator, Optional
 
 from fastapi import HTTPException
-from sqlalchemy import select, asc, func
+from sqlalchemy import select, update, asc, Select, extract, literal_column, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.DB.models import Contact, User
@@ -27,26 +28,68 @@ async def get_specific_contact_belongs_to_user(id: int, user: User, db: AsyncSes
         HTTPException(404): Если контакт с указанным идентификатором не найден.
     """
 
-    stmt = select(Contact).where(Contact.user_id == user.id).filter(Contact.id == id)
+    stmt = select(Contact).where(Contact.user_id == user.id, Contact.id == id).limit(1)
     contact_data = await db.execute(stmt)
     contact = contact_data.scalar()
     return contact
 
 
+def paginate_contacts(condition, limit: int, offset: int, after_id: Optional[int] = None) -> Select:
+    """
+    Построить запрос страницы контактов, удовлетворяющих условию, в порядке возрастания id.
+
+    При наличии курсора `after_id` используется keyset-пагинация (`WHERE id > after_id`).
+    Иначе применяется отложенное соединение (deferred join): `offset` пропускается во вложенном
+    запросе, который читает только `id` по индексу `(user_id, id)`, а полные строки контактов
+    подгружаются лишь для итоговых `limit` записей.
+
+    Args:
+        condition: Условие отбора контактов (например, `Contact.user_id == user.id`).
+        limit (int): Максимальное количество полученных контактов.
+        offset (int): Количество контактов, пропущенных с начала результатов.
+        after_id (int, optional): Идентификатор последнего контакта предыдущей страницы.
+
+    Returns:
+        Select: Запрос SQLAlchemy, возвращающий объекты Contact.
+    """
+
+    if after_id is not None:
+        return (
+            select(Contact)
+            .where(condition, Contact.id > after_id)
+            .limit(limit)
+            .order_by(asc(Contact.id))
+        )
+
+    page_ids = (
+        select(Contact.id)
+        .where(condition)
+        .order_by(asc(Contact.id))
+        .offset(offset)
+        .limit(limit)
+        .subquery()
+    )
+    return select(Contact).join(page_ids, Contact.id == page_ids.c.id).order_by(asc(Contact.id))
+
+
 # OK
 async def repo_get_contacts(
-    db: AsyncSession, user: User, limit: int, offset: int
+    db: AsyncSession, user: User, limit: int, offset: int, after_id: Optional[int] = None
 ) -> list[Contact]:
     """
     Получить список контактов пользователя.
 
     Эта функция получает список контактов из базы данных, принадлежащих пользователю.
+    Если передан курсор `after_id`, используется keyset-пагинация (`WHERE id > after_id`),
+    которая читает только `limit` строк по индексу. Пагинация через `offset` оставлена
+    для обратной совместимости, но ее стоимость растет линейно с величиной `offset`.
 
     Args:
         db(AsyncSession): Асинхронная сессия базы данных для взаимодействия с ней.
         user(User): Объект пользователя, для которого получаем контакты.
         limit (int): Максимальное количество полученных контактов.
-        offset (int): Количество контактов, пропущенных с начала результатов.
+        offset (int): Количество контактов, пропущенных с начала результатов (игнорируется при `after_id`).
+        after_id (int, optional): Идентификатор последнего контакта предыдущей страницы.
 
     Returns:
         List[Contact]: Список объектов контактов, принадлежащих пользователю.
@@ -56,17 +99,37 @@ async def repo_get_contacts(
                             или доступ к контактам.
     """
 
-    contacts_data = (
-        select(Contact)
-        .where(Contact.user_id == user.id)
-        .offset(offset)
-        .limit(limit)
-        .order_by(asc(Contact.id))
-    )
+    contacts_data = paginate_contacts(Contact.user_id == user.id, limit, offset, after_id)
     result = await db.execute(contacts_data)
     return result.scalars().all()
 
 
+async def repo_stream_contacts(
+    db: AsyncSession, user: User, limit: int, offset: int, after_id: Optional[int] = None
+) -> AsyncIterator[Contact]:
+    """
+    Потоково получить контакты пользователя.
+
+    В отличие от repo_get_contacts(), не загружает весь список в память: строки читаются
+    из серверного курсора порциями и отдаются по одной.
+
+    Args:
+        db(AsyncSession): Асинхронная сессия базы данных для взаимодействия с ней.
+        user(User): Объект пользователя, для которого получаем контакты.
+        limit (int): Максимальное количество полученных контактов.
+        offset (int): Количество контактов, пропущенных с начала результатов (игнорируется при `after_id`).
+        after_id (int, optional): Идентификатор последнего контакта предыдущей страницы.
+
+    Yields:
+        Contact: Объекты контактов, принадлежащие пользователю, в порядке возрастания id.
+    """
+
+    stmt = paginate_contacts(Contact.user_id == user.id, limit, offset, after_id)
+    result = await db.stream(stmt.execution_options(yield_per=100))
+    async for contact in result.scalars():
+        yield contact
+
+
 # OK
 async def repo_get_contact_by_id(id: int, user: User, db: AsyncSession):
     """
@@ -119,8 +182,8 @@ async def repo_create_new_contact(user: User, body: ContactCreate, db: AsyncSess
 
     contact = Contact(**body.dict(), user_id=user.id)
     db.add(contact)
-    await db.flush()
-    await db.refresh(contact)
+    # INSERT ... RETURNING заполняет id, а остальные поля заданы на клиенте,
+    # поэтому flush() и refresh() не нужны (сессия создана с expire_on_commit=False).
     await db.commit()
     return contact
 
@@ -133,8 +196,7 @@ async def repo_update_contact_db(
     Обновить существующий контакт для пользователя.
 
     Эта функция обновляет контакт существующего в пользовательской базе данных с указанным идентификатором.
-    В ней используется функция для нахождения конкретного контакта get_specific_contact_belongs_to_user(),
-    с расширенными возможностями для данного случая – (обновление информации о контакте).
+    Обновление выполняется одним запросом UPDATE ... RETURNING без предварительной выборки контакта.
 
     Args:
         id (int): Идентификатор контакта, который необходимо обновить.
@@ -151,15 +213,22 @@ async def repo_update_contact_db(
         HTTPException(404): Если контакт с указанным идентификатором не найден.
     """
 
-    contact = await get_specific_contact_belongs_to_user(id, user, db)
+    values = body.dict(exclude_unset=True)
+    if not values:
+        return await repo_get_contact_by_id(id, user, db)
+
+    stmt = (
+        update(Contact)
+        .where(Contact.id == id, Contact.user_id == user.id)
+        .values(**values)
+        .returning(Contact)
+    )
+    result = await db.execute(stmt)
+    contact = result.scalar_one_or_none()
     if contact is None:
         raise HTTPException(status_code=404, detail="Contact not found")
 
-    for field, value in body.dict(exclude_unset=True).items():
-        setattr(contact, field, value)
-
     await db.commit()
-    await db.refresh(contact)
     return contact
 
 
@@ -205,21 +274,24 @@ async def repo_delete_contact_db(id: int, user: User, db: AsyncSession):
 
 # OK
 async def repo_get_contacts_query(
-    user: User, query: str, limit: int, offset: int, db: AsyncSession
+    user: User, query: str, limit: int, offset: int, db: AsyncSession, after_id: Optional[int] = None
 ):
     """
     Получите список контактов пользователя по запросу поиска.
 
     Эта функция получает список контактов из базы данных, принадлежащих пользователю,
     и соответствуют заданному поисковому запросу.
-    Поиск происходит в полях `first_name`, `last_name`, `email`.
+    Поиск происходит в полях `first_name`, `last_name`, `email` без учета регистра (ILIKE),
+    для каждого поля есть триграммный GIN-индекс.
+    Пагинация работает так же, как в repo_get_contacts(): курсор `after_id` предпочтительнее `offset`.
 
     Args:
         user(User): Объект пользователя, для которого получаем контакты.
         query (str): Поисковый запрос для фильтрации контактов.
         limit (int): Максимальное количество полученных контактов.
-        offset (int): Количество контактов, пропущенных с начала результатов.
+        offset (int): Количество контактов, пропущенных с начала результатов (игнорируется при `after_id`).
         db(AsyncSession): Асинхронная сессия базы данных для взаимодействия с ней.
+        after_id (int, optional): Идентификатор последнего контакта предыдущей страницы.
 
     Returns:
         List[Contact]: Список объектов контактов, принадлежащих пользователю и соответствующих запросу.
@@ -230,22 +302,13 @@ async def repo_get_contacts_query(
     """
 
     search_query = f"%{query}%"
-    lower_search_query = search_query.lower()
 
-    stmt = (
-        select(Contact)
-        .where(
-            (Contact.user_id == user.id)
-            & (
-                (func.lower(Contact.first_name).like(lower_search_query))
-                | (func.lower(Contact.last_name).like(lower_search_query))
-                | (func.lower(Contact.email).like(lower_search_query))
-            )
-        )
-        .offset(offset)
-        .limit(limit)
-        .order_by(asc(Contact.id))
+    condition = (Contact.user_id == user.id) & (
+        (Contact.first_name.ilike(search_query))
+        | (Contact.last_name.ilike(search_query))
+        | (Contact.email.ilike(search_query))
     )
+    stmt = paginate_contacts(condition, limit, offset, after_id)
 
     contacts_data = await db.execute(stmt)
     return contacts_data.scalars().all()
@@ -274,16 +337,15 @@ async def repo_get_upcoming_birthday_contacts(user: User, db: AsyncSession):
 
     today = datetime.datetime.now().date()
     end_date = today + datetime.timedelta(days=7)
-
-    answer_contacts = []
-    results = await db.execute(select(Contact).filter(Contact.user_id == user.id))
-    contacts: list[Contact] = results.scalars().all()
-
-    for contact in contacts:
-        b_day = contact.b_day
-        today_year_b_day = datetime.datetime(today.year, b_day.month, b_day.day).date()
-
-        if today <= today_year_b_day <= end_date:
-            answer_contacts.append(contact)
-
-    return answer_contacts
+    start_key = today.month * 100 + today.day
+    end_key = end_date.month * 100 + end_date.day
+
+    # Ключ MMDD вычисляется на стороне БД и совпадает с выражением индекса ix_contacts_user_id_birthday.
+    birthday_key = extract("month", Contact.b_day) * literal_column("100") + extract("day", Contact.b_day)
+    if start_key <= end_key:
+        in_window = birthday_key.between(start_key, end_key)
+    else:
+        in_window = or_(birthday_key >= start_key, birthday_key <= end_key)
+
+    results = await db.execute(select(Contact).where(Contact.user_id == user.id, in_window))
+    return results.scalars().all()
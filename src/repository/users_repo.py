@@ -1,7 +1,8 @@
 from datetime import datetime
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import load_only
 from libgravatar import Gravatar
 
 from src.DB.models import User
@@ -15,7 +16,8 @@ async def repo_create_user(body: UserCreate, db: AsyncSession):
 
     Эта функция создает нового пользователя с данными и сохраняет его в базе данных.
     Для присвоения аватара используется libgravatar, автоматически присваивающий аватар пользователю,
-    в соответствии с пользовательским имейлом.
+    в соответствии с пользовательским имейлом. URL аватара вычисляется локально (md5 от имейла),
+    сетевых запросов к gravatar.com при регистрации не выполняется.
 
     Args:
         body (UserCreate): Объект `UserCreate`, содержащий данные для создания нового пользователя.
@@ -50,6 +52,9 @@ async def repo_user_authentication_by_email(email: str, db: AsyncSession) -> Use
 
     Эта функция ищет пользователя в базе данных по его электронной почте
     и возвращает пользовательский объект, если такой пользователь существует.
+    Загружаются только поля, покрытые индексом ix_users_email (id, email, username, password,
+    avatar, is_activated), поэтому запрос выполняется как index-only scan. Для доступа к
+    `refresh_token`, `reset_token` или `created_at` используйте repo_get_user_by_email().
 
     Args:
         email (str): Электронная почта пользователя, которого нужно найти.
@@ -59,12 +64,39 @@ async def repo_user_authentication_by_email(email: str, db: AsyncSession) -> Use
         User: Объект пользователя, если пользователь с указанным электронным адресом существует.
             Если пользователь с такой электронной почтой не найден, возвращается None.
     """
-    query = select(User).where(User.email == email)
+    query = (
+        select(User)
+        .options(
+            load_only(
+                User.id, User.email, User.username, User.password, User.avatar, User.is_activated
+            )
+        )
+        .where(User.email == email)
+    )
     result = await db.execute(query)
     existing_user = result.scalar()
     return existing_user
 
 
+async def repo_get_user_by_email(email: str, db: AsyncSession) -> User:
+    """
+    Получает пользователя со всеми полями по электронной почте.
+
+    В отличие от repo_user_authentication_by_email(), загружает полную строку пользователя,
+    включая токены обновления и сброса пароля.
+
+    Args:
+        email (str): Электронная почта пользователя, которого нужно найти.
+        db(AsyncSession): Асинхронная сессия базы данных для взаимодействия с ней.
+
+    Returns:
+        User: Объект пользователя или None, если пользователь с такой электронной почтой не найден.
+    """
+    query = select(User).where(User.email == email)
+    result = await db.execute(query)
+    return result.scalar()
+
+
 async def repo_update_refresh_token(
     user: User, new_refresh_token: str, db: AsyncSession
 ):
@@ -91,8 +123,8 @@ async def confirmed_email(email: str, db: AsyncSession):
     Подтверждает электронную почту пользователя.
 
     Эта функция подтверждает электронную почту пользователя, обновляя статус активации.
-    Она устанавливает значение поля `is_activated` пользователя на True, указывая, что
-    электронная почта была успешно подтверждена.
+    Она устанавливает значение поля `is_activated` пользователя на True одним запросом UPDATE,
+    указывая, что электронная почта была успешно подтверждена.
 
     Args:
         email (str): Электронная почта пользователя, которую нужно подтвердить.
@@ -102,8 +134,7 @@ async def confirmed_email(email: str, db: AsyncSession):
         None
     """
 
-    user = await repo_user_authentication_by_email(email=email, db=db)
-    user.is_activated = True
+    await db.execute(update(User).where(User.email == email).values(is_activated=True))
     await db.commit()
 
 
@@ -112,7 +143,7 @@ async def update_avatar(email, src_url, db: AsyncSession):
     Обновляет аватар пользователя.
 
     Эта функция обновляет аватар (URL изображения) пользователя в базе данных по указанной электронной почте.
-    Она находит пользователя по его электронной почте, обновляет поле `avatar` на новый URL аватара
+    Она обновляет поле `avatar` на новый URL аватара одним запросом UPDATE ... RETURNING
     и сохраняет изменения в базе данных.
 
     Args:
@@ -124,8 +155,10 @@ async def update_avatar(email, src_url, db: AsyncSession):
         User: Объект пользователя с обновленным аватаром.
     """
 
-    user = await repo_user_authentication_by_email(email=email, db=db)
-    user.avatar = src_url
+    result = await db.execute(
+        update(User).where(User.email == email).values(avatar=src_url).returning(User)
+    )
+    user = result.scalar_one()
     await db.commit()
     return user
 
@@ -135,7 +168,8 @@ async def add_reset_token_to_db(user, reset_token, db: AsyncSession):
     Добавляет токен сброс пароля (reset token) к пользователю.
 
     Эта функция добавляет токен сброса пароля (reset token) к указанному пользователю в базе данных.
-    Она сохраняет новый токен сброса пароля в поле `reset_token` пользователя и сохраняет изменения в базе данных.
+    Она сохраняет новый токен сброса пароля в поле `reset_token` пользователя одним запросом UPDATE
+    и сохраняет изменения в базе данных.
 
     Args:
         user: Объект пользователя, для которого нужно добавить токен сброса пароля.
@@ -145,5 +179,5 @@ async def add_reset_token_to_db(user, reset_token, db: AsyncSession):
         None
     """
 
-    user.reset_token = reset_token
+    await db.execute(update(User).where(User.id == user.id).values(reset_token=reset_token))
     await db.commit()
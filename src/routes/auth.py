@@ -61,7 +61,7 @@ async def login(body: OAuth2PasswordRequestForm = Depends(), db: AsyncSession =
 async def refresh_token(creds: HTTPAuthorizationCredentials = Security(security), db: AsyncSession = Depends(get_db)):
     token = creds.credentials
     email = await auth_service.decode_refresh_token(token)
-    user = await user_repository.repo_user_authentication_by_email(email=email, db=db)
+    user = await user_repository.repo_get_user_by_email(email=email, db=db)
     if token != user.refresh_token:
         await user_repository.repo_update_refresh_token(user=user, new_refresh_token=None, db=db)
         raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid refresh token.")
@@ -69,7 +69,7 @@ async def refresh_token(creds: HTTPAuthorizationCredentials = Security(security)
     refresh_token_ = await auth_service.create_refresh_token(data={"sub": email})
     await user_repository.repo_update_refresh_token(user=user, new_refresh_token=refresh_token_, db=db)
     user_data = UserDBScheme(username=user.username, email=user.email, avatar=user.avatar)
-    return OnLoginResponse(user=user_data, access_token=access_token, refresh_token=refresh_token)
+    return OnLoginResponse(user=user_data, access_token=access_token, refresh_token=refresh_token_)
 
 
 @auth_router.get("/email_confirmation/{token}")
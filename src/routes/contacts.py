@@ -1,12 +1,17 @@
-from fastapi import APIRouter, Depends, Query, status
+from typing import AsyncIterator, Optional
+
+import orjson
+from fastapi import APIRouter, Depends, Query, Response, status
+from fastapi.responses import StreamingResponse
 from fastapi_limiter.depends import RateLimiter
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.DB.db import get_db
-from src.DB.models import User
+from src.DB.models import Contact, User
 from src.repository.contacts_repo import (
     repo_get_contacts,
+    repo_stream_contacts,
     repo_get_contact_by_id,
     repo_create_new_contact,
     repo_update_contact_db,
@@ -19,17 +24,59 @@ from src.services.authservice import authservice as auth_service
 
 router = APIRouter(prefix="/contacts", tags=["contacts"])
 
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def set_next_cursor(response: Response, contacts: list, limit: int):
+    """Передает клиенту курсор следующей страницы (id последнего контакта) в заголовке ответа."""
+    if contacts and len(contacts) == limit:
+        response.headers[NEXT_CURSOR_HEADER] = str(contacts[-1].id)
+
+
+async def contacts_json_stream(contacts: AsyncIterator[Contact]) -> AsyncIterator[bytes]:
+    """Сериализует контакты в JSON-массив по одному, не собирая весь ответ в памяти."""
+    yield b"["
+    separator = b""
+    async for contact in contacts:
+        yield separator + orjson.dumps(ContactResponse.from_orm(contact).dict())
+        separator = b","
+    yield b"]"
+
 
 # CRUD block
 # OK
 @router.get("/", tags=["contacts"], response_model=list[ContactResponse])
 async def get_contacts_db(
+    response: Response,
     user: User = Depends(auth_service.get_current_user),
     limit: int = 10,
     offset: int = 0,
+    after_id: Optional[int] = None,
+    db: AsyncSession = Depends(get_db),
+):
+    contacts = await repo_get_contacts(user=user, limit=limit, offset=offset, after_id=after_id, db=db)
+    set_next_cursor(response, contacts, limit)
+    return contacts
+
+
+# OK
+@router.get("/stream/", tags=["contacts"], response_model=list[ContactResponse])
+async def stream_contacts_db(
+    user: User = Depends(auth_service.get_current_user),
+    limit: int = 1000,
+    offset: int = 0,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
 ):
-    return await repo_get_contacts(user=user, limit=limit, offset=offset, db=db)
+    """
+    Потоково отдать контакты пользователя в виде JSON-массива.
+
+    Статус 200 и заголовки отправляются до чтения первой строки, поэтому ошибка базы данных
+    посреди потока не превращается в ответ 500, как в `/contacts/`: клиент получит обрезанное
+    тело с невалидным JSON. Клиенту следует считать такой ответ неудачным.
+    """
+    contacts = repo_stream_contacts(user=user, limit=limit, offset=offset, after_id=after_id, db=db)
+    return StreamingResponse(contacts_json_stream(contacts), media_type="application/json")
 
 
 # OK
@@ -88,15 +135,19 @@ async def delete_contact_db(
 # OK
 @router.get("/query/", tags=["contacts"], response_model=list[ContactResponse])
 async def get_contacts_query(
+    response: Response,
     user: User = Depends(auth_service.get_current_user),
     query: str = Query(min_length=2, max_length=100),
     limit: int = 10,
     offset: int = 0,
+    after_id: Optional[int] = None,
     db: AsyncSession = Depends(get_db),
 ):
-    return await repo_get_contacts_query(
-        user=user, query=query, limit=limit, offset=offset, db=db
+    contacts = await repo_get_contacts_query(
+        user=user, query=query, limit=limit, offset=offset, after_id=after_id, db=db
     )
+    set_next_cursor(response, contacts, limit)
+    return contacts
 
 
 """API должен получить список контактов с днями рождения на ближайшие 7 дней."""
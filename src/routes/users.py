@@ -1,3 +1,5 @@
+import asyncio
+
 import cloudinary
 import cloudinary.uploader
 from fastapi import APIRouter, Depends, UploadFile, File
@@ -9,7 +11,7 @@ from src.conf.config import settings
 from src.schemas.User_Schemas import UserDBScheme
 from src.services.authservice import authservice as auth_service
 from src.repository import users_repo as user_repository
-from src.services.avatar import UploadImage
+from src.services.avatar import UploadImage, UPLOAD_EXECUTOR
 
 user_router = APIRouter()
 
@@ -99,7 +101,8 @@ async def update_user_avatar(
     )
 
     public_id = UploadImage.generate_name_avatar(current_user.email)
-    r = UploadImage.upload(file.file, public_id)
+    loop = asyncio.get_running_loop()
+    r = await loop.run_in_executor(UPLOAD_EXECUTOR, UploadImage.upload, file.file, public_id)
     src_url = UploadImage.get_url_for_avatar(public_id, r)
     user = await user_repository.update_avatar(
         email=current_user.email, src_url=src_url, db=db
@@ -1,9 +1,15 @@
-from datetime import datetime, timedelta
+import hashlib
+import hmac
+import os
+import time
+from datetime import datetime, timedelta, timezone
 from typing import Optional
 
+from cachetools import TTLCache
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
-from jose import jwt, JWTError
+import jwt
+from jwt import InvalidTokenError as JWTError
 from passlib.context import CryptContext
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -19,14 +25,22 @@ class Auth:
 
     Attributes:
         pwd_cxt (CryptContext): Объект для хеширования паролей с помощью bcrypt.
-        SECRET_KEY(str): Секретный ключ для подписи JWT.
+        SECRET_KEY(bytes): Секретный ключ для подписи JWT, заранее закодированный в байты.
         ALGR(str): Алгоритм подписи JWT.
+        ALGORITHMS(list[str]): Список допустимых алгоритмов для проверки JWT.
         oauth2_scheme (OAuth2PasswordBearer): Объект для получения токена из HTTP-запроса.
+        verified_passwords (TTLCache): Кэш успешных проверок пароля, ключ – HMAC-SHA256 от пары (хэш, пароль).
+        verified_passwords_key (bytes): Случайный ключ HMAC для кэша проверок, свой в каждом процессе.
+        token_cache (TTLCache): Кэш проверенных токенов доступа: token -> (email, exp).
     """
 
     pwd_cxt = CryptContext(schemes=["bcrypt"], deprecated="auto")
-    SECRET_KEY = settings.secret_key
+    verified_passwords = TTLCache(maxsize=1024, ttl=600)
+    verified_passwords_key = os.urandom(32)
+    token_cache = TTLCache(maxsize=10_000, ttl=60)
+    SECRET_KEY = settings.secret_key.encode()
     ALGR = settings.algorithm
+    ALGORITHMS = [ALGR]
     oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/auth/login")
 
     def generate_password_hash(self, password: str):
@@ -45,6 +59,9 @@ class Auth:
         """
         Проверяет, соответствует ли пароль сохраненному хешу.
 
+        Успешные проверки кэшируются на 10 минут, чтобы не выполнять дорогой bcrypt повторно
+        для одной и той же пары. Неудачные проверки не кэшируются.
+
         Args:
             hashed_password (str): Сохраненный хэш пароля, созданный с помощью bcrypt.
             password (str): Пароль в открытом виде для проверки.
@@ -52,7 +69,15 @@ class Auth:
         Returns:
             bool: True, если пароли соответствуют друг другу, False – в противном случае.
         """
-        return self.pwd_cxt.verify(password, hashed_password)
+        key = hmac.new(
+            self.verified_passwords_key, f"{hashed_password}:{password}".encode(), hashlib.sha256
+        ).digest()
+        if key in self.verified_passwords:
+            return True
+        is_valid = self.pwd_cxt.verify(password, hashed_password)
+        if is_valid:
+            self.verified_passwords[key] = True
+        return is_valid
 
     async def create_access_token(
         self, data: dict, expires_delta: Optional[float] = None
@@ -68,15 +93,14 @@ class Auth:
             str: Токен доступа в виде строки JWT.
         """
         to_encode = data.copy()
+        now = datetime.now(tz=timezone.utc)
 
         if expires_delta:
-            expires = datetime.utcnow() + timedelta(seconds=expires_delta)
+            expires = now + timedelta(seconds=expires_delta)
         else:
-            expires = datetime.utcnow() + timedelta(minutes=15)
+            expires = now + timedelta(minutes=15)
 
-        to_encode.update(
-            {"iat": datetime.utcnow(), "exp": expires, "scope": "access_token"}
-        )
+        to_encode.update({"iat": now, "exp": expires, "scope": "access_token"})
         access_token = jwt.encode(to_encode, key=self.SECRET_KEY, algorithm=self.ALGR)
         return access_token
 
@@ -94,15 +118,14 @@ class Auth:
             str: Токен обновления в виде строки JWT.
         """
         to_encode = data.copy()
+        now = datetime.now(tz=timezone.utc)
 
         if expires_delta:
-            expires = datetime.utcnow() + timedelta(seconds=expires_delta)
+            expires = now + timedelta(seconds=expires_delta)
         else:
-            expires = datetime.utcnow() + timedelta(days=7)
+            expires = now + timedelta(days=7)
 
-        to_encode.update(
-            {"iat": datetime.utcnow(), "exp": expires, "scope": "access_token"}
-        )
+        to_encode.update({"iat": now, "exp": expires, "scope": "refresh_token"})
         refresh_token = jwt.encode(to_encode, key=self.SECRET_KEY, algorithm=self.ALGR)
         return refresh_token
 
@@ -111,6 +134,11 @@ class Auth:
     ):
         """
         Получить текущего аутентифицированного пользователя с помощью токена доступа.
+
+        Результат проверки JWT (электронная почта и срок действия) кэшируется по токену на 60 секунд,
+        но не дольше срока действия токена, поэтому повторные запросы с тем же токеном не декодируют JWT.
+        Сам пользователь загружается из базы данных при каждом запросе, чтобы данные были актуальными.
+
         Args:
             token (str, optional): Токен доступа в формате Bearer. По умолчанию: Depends(oauth2_scheme).
             db(AsyncSession, optional): Асинхронный сеанс базы данных. По умолчанию Depends(get_db).
@@ -128,15 +156,24 @@ class Auth:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-        try:
-            payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=[self.ALGR])
-            if payload.get("scope") != "access_token":
+        email = None
+        cached = self.token_cache.get(token)
+        if cached is not None:
+            cached_email, expires_at = cached
+            if expires_at > time.time():
+                email = cached_email
+            else:
+                self.token_cache.pop(token, None)
+
+        if email is None:
+            try:
+                payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=self.ALGORITHMS)
+            except JWTError:
                 raise credentials_exception
             email = payload.get("sub")
-            if email is None:
+            if payload.get("scope") != "access_token" or email is None:
                 raise credentials_exception
-        except JWTError:
-            raise credentials_exception
+            self.token_cache[token] = (email, payload["exp"])
 
         user = await user_repository.repo_user_authentication_by_email(email, db)
         if user is None:
@@ -155,10 +192,9 @@ class Auth:
             str: Токен подтверждения электронной почты в формате JWT (JSON Web Token) в виде строки.
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(hours=1)
-        to_encode.update(
-            {"iat": datetime.utcnow(), "exp": expire, "scope": "email_token"}
-        )
+        now = datetime.now(tz=timezone.utc)
+        expire = now + timedelta(hours=1)
+        to_encode.update({"iat": now, "exp": expire, "scope": "email_token"})
         token = jwt.encode(to_encode, key=self.SECRET_KEY, algorithm=self.ALGR)
         return token
 
@@ -177,7 +213,7 @@ class Auth:
         """
         try:
             payload = jwt.decode(
-                refresh_token, key=self.SECRET_KEY, algorithms=[self.ALGR]
+                refresh_token, key=self.SECRET_KEY, algorithms=self.ALGORITHMS
             )
             if payload.get("scope") == "refresh_token":
                 email = payload.get("sub")
@@ -205,7 +241,7 @@ class Auth:
             HTTPException(422): Если токен недействителен для подтверждения электронной почты.
         """
         try:
-            payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=[self.ALGR])
+            payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=self.ALGORITHMS)
             if payload.get("scope") == "email_token":
                 email = payload.get("sub")
                 return email
@@ -227,8 +263,9 @@ class Auth:
             str: Токен для сброса пароля в формате JWT (JSON Web Token) в виде строки.
         """
         to_encode = data.copy()
-        expire = datetime.utcnow() + timedelta(hours=expire)
-        to_encode.update({"iat": datetime.utcnow(), "exp": expire, "scope": "refresh"})
+        now = datetime.now(tz=timezone.utc)
+        expire = now + timedelta(hours=expire)
+        to_encode.update({"iat": now, "exp": expire, "scope": "refresh"})
         reset_token = jwt.encode(to_encode, key=self.SECRET_KEY, algorithm=self.ALGR)
         return reset_token
 
@@ -246,7 +283,7 @@ class Auth:
             HTTPException(422): Если токен недействителен для сброса пароля.
         """
         try:
-            payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=[self.ALGR])
+            payload = jwt.decode(token, key=self.SECRET_KEY, algorithms=self.ALGORITHMS)
             if payload.get("scope") == "refresh":
                 email = payload.get("sub")
                 return email
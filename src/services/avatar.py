@@ -1,9 +1,14 @@
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 
 import cloudinary
 import cloudinary.uploader
 from src.conf.config import settings
 
+# Отдельный ограниченный пул для блокирующих загрузок в Cloudinary, чтобы медленные загрузки
+# не занимали общий executor цикла событий.
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=4, thread_name_prefix="avatar-upload")
+
 
 class UploadImage:
     cloudinary.config(
@@ -7,6 +7,7 @@ from libgravatar import Gravatar
 
 from src.DB.models import User
 from src.schemas.User_Schemas import UserCreationResponse, UserDBScheme
+from src.services.authservice import authservice as auth_service
 
 
 # @pytest.mark.usefixtures("db")
@@ -72,3 +73,27 @@ async def test_register_user_existing_email(client, user, monkeypatch):
 
     assert response.status_code == 409
     assert "Email already exists. Try to log in." in response.json()["detail"]
+
+
+@pytest.mark.asyncio
+async def test_refresh_token_returns_new_tokens(client, user, monkeypatch):
+    refresh_token = await auth_service.create_refresh_token(data={"sub": user["email"]})
+    existing_user = User(
+        username=user["username"], email=user["email"], avatar="avatar.jpg", refresh_token=refresh_token
+    )
+
+    async def mock_repo_get_user_by_email(email, db):
+        return existing_user
+
+    async def mock_repo_update_refresh_token(user, new_refresh_token, db):
+        user.refresh_token = new_refresh_token
+
+    monkeypatch.setattr("src.repository.users_repo.repo_get_user_by_email", mock_repo_get_user_by_email)
+    monkeypatch.setattr("src.repository.users_repo.repo_update_refresh_token", mock_repo_update_refresh_token)
+
+    response = client.get("/auth/refresh_token", headers={"Authorization": f"Bearer {refresh_token}"})
+
+    assert response.status_code == 200, response.text
+    payload = response.json()
+    assert payload["refresh_token"] == existing_user.refresh_token
+    assert await auth_service.decode_refresh_token(payload["refresh_token"]) == user["email"]
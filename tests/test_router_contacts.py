@@ -0,0 +1,125 @@
+import asyncio
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession, async_sessionmaker
+from sqlalchemy.pool import NullPool
+
+from src.DB.db import get_db
+from src.DB.models import Base, User
+from src.routes.contacts import NEXT_CURSOR_HEADER
+from src.services.authservice import authservice as auth_service
+from main import app
+
+
+@pytest.fixture(scope="module")
+def contacts_client(tmp_path_factory):
+    url = f"sqlite+aiosqlite:///{tmp_path_factory.mktemp('db') / 'contacts.db'}"
+    engine = create_async_engine(url, poolclass=NullPool)
+    session_maker = async_sessionmaker(bind=engine, class_=AsyncSession, expire_on_commit=False)
+
+    async def create_tables():
+        async with engine.begin() as connection:
+            await connection.run_sync(Base.metadata.create_all)
+
+    asyncio.run(create_tables())
+
+    async def override_get_db():
+        async with session_maker() as session:
+            yield session
+
+    def override_get_current_user():
+        return User(id=1, username="deadpool", email="deadpool@example.com")
+
+    previous_overrides = app.dependency_overrides.copy()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_service.get_current_user] = override_get_current_user
+
+    client = TestClient(app)
+    create_contacts(client, 5)
+    yield client
+
+    app.dependency_overrides = previous_overrides
+
+
+def create_contacts(client, count):
+    for number in range(count):
+        response = client.post("/contacts/", json={
+            "first_name": f"John{number}",
+            "last_name": "Doe",
+            "email": f"john{number}@example.com",
+            "phone": "0123456789",
+            "b_day": "1999-07-10",
+        })
+        assert response.status_code == 201, response.text
+
+
+def test_get_contacts_keyset_pagination(contacts_client):
+    first_page = contacts_client.get("/contacts/", params={"limit": 2})
+    assert first_page.status_code == 200, first_page.text
+    assert [contact["id"] for contact in first_page.json()] == [1, 2]
+    assert first_page.headers[NEXT_CURSOR_HEADER] == "2"
+
+    second_page = contacts_client.get(
+        "/contacts/", params={"limit": 2, "after_id": first_page.headers[NEXT_CURSOR_HEADER]}
+    )
+    assert [contact["id"] for contact in second_page.json()] == [3, 4]
+    assert second_page.headers[NEXT_CURSOR_HEADER] == "4"
+
+    last_page = contacts_client.get(
+        "/contacts/", params={"limit": 2, "after_id": second_page.headers[NEXT_CURSOR_HEADER]}
+    )
+    assert [contact["id"] for contact in last_page.json()] == [5]
+    assert NEXT_CURSOR_HEADER not in last_page.headers
+
+
+def test_get_contacts_query_keyset_pagination(contacts_client):
+    first_page = contacts_client.get("/contacts/query/", params={"query": "john", "limit": 3})
+    assert [contact["id"] for contact in first_page.json()] == [1, 2, 3]
+    assert first_page.headers[NEXT_CURSOR_HEADER] == "3"
+
+    last_page = contacts_client.get(
+        "/contacts/query/", params={"query": "john", "limit": 3, "after_id": 3}
+    )
+    assert [contact["id"] for contact in last_page.json()] == [4, 5]
+    assert NEXT_CURSOR_HEADER not in last_page.headers
+
+
+def test_next_cursor_header_is_exposed_to_browsers(contacts_client):
+    response = contacts_client.get(
+        "/contacts/", params={"limit": 2}, headers={"Origin": "https://example.com"}
+    )
+    assert response.headers[NEXT_CURSOR_HEADER] == "2"
+    assert NEXT_CURSOR_HEADER in response.headers["access-control-expose-headers"]
+
+
+def test_stream_contacts_empty(contacts_client):
+    response = contacts_client.get("/contacts/stream/", params={"after_id": 5})
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"] == "application/json"
+    assert response.content == b"[]"
+    assert json.loads(response.content) == []
+
+
+def test_stream_contacts_single_row(contacts_client):
+    response = contacts_client.get("/contacts/stream/", params={"after_id": 4})
+    contacts = json.loads(response.content)
+    assert contacts == [{
+        "id": 5,
+        "first_name": "John4",
+        "last_name": "Doe",
+        "email": "john4@example.com",
+        "phone": "0123456789",
+        "b_day": "1999-07-10",
+        "rest_data": None,
+    }]
+
+
+def test_stream_contacts_several_rows(contacts_client):
+    response = contacts_client.get("/contacts/stream/")
+    contacts = json.loads(response.content)
+    assert [contact["id"] for contact in contacts] == [1, 2, 3, 4, 5]
+    assert all(contact["b_day"] == "1999-07-10" for contact in contacts)
+    assert response.content.count(b"},{") == 4
+    assert contacts == contacts_client.get("/contacts/", params={"limit": 5}).json()
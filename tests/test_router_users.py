@@ -0,0 +1,46 @@
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from src.DB.db import get_db
+from src.DB.models import User
+from src.services.authservice import authservice as auth_service
+from main import app
+
+
+@pytest.fixture(scope="module")
+def users_client():
+    current_user = User(id=1, username="deadpool", email="deadpool@example.com", avatar="old.jpg")
+
+    async def override_get_db():
+        yield None
+
+    previous_overrides = app.dependency_overrides.copy()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[auth_service.get_current_user] = lambda: current_user
+
+    yield TestClient(app)
+
+    app.dependency_overrides = previous_overrides
+
+
+def test_update_avatar_uploads_on_dedicated_executor(users_client, monkeypatch):
+    upload_threads = []
+
+    def mock_upload(file, public_id):
+        upload_threads.append(threading.current_thread().name)
+        return {"version": 1}
+
+    async def mock_update_avatar(email, src_url, db):
+        return User(username="deadpool", email=email, avatar=src_url)
+
+    monkeypatch.setattr("src.services.avatar.UploadImage.upload", mock_upload)
+    monkeypatch.setattr("src.repository.users_repo.update_avatar", mock_update_avatar)
+
+    response = users_client.patch("/users/avatar", files={"file": ("avatar.png", b"image", "image/png")})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["avatar"].startswith("https://")
+    assert len(upload_threads) == 1
+    assert upload_threads[0].startswith("avatar-upload")
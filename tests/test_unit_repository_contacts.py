@@ -4,11 +4,12 @@ from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy.dialects import postgresql
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.DB.models import Contact, User
 from src.repository.contacts_repo import repo_get_contacts, get_specific_contact_belongs_to_user, \
     repo_update_contact_db, repo_get_contact_by_id, repo_create_new_contact, repo_delete_contact_db, \
-    repo_get_contacts_query, repo_get_upcoming_birthday_contacts
+    repo_get_contacts_query, repo_get_upcoming_birthday_contacts, repo_stream_contacts
 from src.schemas.Contacts_Schemas import ContactCreate, ContactUpdate
 
 
@@ -43,6 +44,54 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
         for contact in result:
             self.assertIsInstance(contact, Contact)
 
+    async def test_repo_get_contacts_after_id(self):
+        expected_contacts = [
+            Contact(id=3, first_name="John", last_name="Doe", email="test@example.com", user_id=self.user.id),
+        ]
+        async_result_mock = MagicMock()
+        async_result_mock.scalars.return_value.all.return_value = expected_contacts
+        self.async_session.execute.return_value = async_result_mock
+
+        result = await repo_get_contacts(db=self.async_session, user=self.user, limit=10, offset=0, after_id=2)
+        self.assertEqual(result, expected_contacts)
+
+        stmt = self.async_session.execute.call_args.args[0]
+        self.assertNotIn("OFFSET", str(stmt))
+        self.assertIn("contacts.id >", str(stmt))
+
+    async def test_repo_get_contacts_offset_uses_deferred_join(self):
+        async_result_mock = MagicMock()
+        async_result_mock.scalars.return_value.all.return_value = []
+        self.async_session.execute.return_value = async_result_mock
+
+        await repo_get_contacts(db=self.async_session, user=self.user, limit=10, offset=20)
+
+        stmt = self.async_session.execute.call_args.args[0]
+        # OFFSET is applied only inside the id subquery; the outer query ends with ORDER BY
+        self.assertIn("JOIN (SELECT contacts.id", str(stmt))
+        self.assertTrue(str(stmt).endswith("ORDER BY contacts.id ASC"))
+
+    async def test_repo_stream_contacts(self):
+        expected_contacts = [
+            Contact(id=1, first_name="John", last_name="Doe", email="test@example.com", user_id=self.user.id),
+            Contact(id=2, first_name="Jane", last_name="Doe", email="test@example.com", user_id=self.user.id)
+        ]
+
+        async def rows():
+            for contact in expected_contacts:
+                yield contact
+
+        stream_result_mock = MagicMock()
+        stream_result_mock.scalars.return_value = rows()
+        self.async_session.stream.return_value = stream_result_mock
+
+        result = [contact async for contact in
+                  repo_stream_contacts(db=self.async_session, user=self.user, limit=10, offset=0)]
+        self.assertEqual(result, expected_contacts)
+
+        stmt = self.async_session.stream.call_args.args[0]
+        self.assertEqual(stmt.get_execution_options()["yield_per"], 100)
+
     async def test_repo_get_contact_by_id_contact_not_found(self):
         expected_contact = None
         with unittest.mock.patch('src.repository.contacts_repo.get_specific_contact_belongs_to_user',
@@ -75,8 +124,6 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
         self.assertTrue(hasattr(result, "id"))
 
     async def test_repo_update_contact_db(self):
-        existing_contact = Contact(id=1, first_name="John", last_name="Doe", email="test@example.com",
-                                   user_id=self.user.id)
         body = ContactUpdate(
             first_name="John",
             last_name="Doe",
@@ -85,11 +132,19 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
             b_day="1999-07-10",
             rest_data="",
         )
-        with unittest.mock.patch('src.repository.contacts_repo.get_specific_contact_belongs_to_user',
-                                 return_value=existing_contact):
-            result = await repo_update_contact_db(id=1, user=self.user, db=self.async_session, body=body)
-            self.assertTrue(hasattr(result, "phone"))
-            self.assertEqual(body.phone, existing_contact.phone)
+        updated_contact = Contact(id=1, user_id=self.user.id, **body.dict())
+        async_result_mock = MagicMock()
+        async_result_mock.scalar_one_or_none.return_value = updated_contact
+        self.async_session.execute.return_value = async_result_mock
+
+        result = await repo_update_contact_db(id=1, user=self.user, db=self.async_session, body=body)
+        self.assertTrue(hasattr(result, "phone"))
+        self.assertEqual(body.phone, result.phone)
+
+        stmt = self.async_session.execute.call_args.args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.compile().params["phone"], body.phone)
+        self.async_session.commit.assert_awaited_once()
 
     async def test_repo_update_contact_db_id_not_found(self):
         expected_contact = None
@@ -101,12 +156,15 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
             b_day="1999-07-10",
             rest_data="",
         )
-        with unittest.mock.patch('src.repository.contacts_repo.get_specific_contact_belongs_to_user',
-                                 return_value=expected_contact):
-            with self.assertRaises(HTTPException) as exc:
-                await repo_update_contact_db(id=1, user=self.user, db=self.async_session, body=body)
-            self.assertEqual(exc.exception.status_code, 404)
-            self.assertEqual(exc.exception.detail, "Contact not found")
+        async_result_mock = MagicMock()
+        async_result_mock.scalar_one_or_none.return_value = expected_contact
+        self.async_session.execute.return_value = async_result_mock
+
+        with self.assertRaises(HTTPException) as exc:
+            await repo_update_contact_db(id=1, user=self.user, db=self.async_session, body=body)
+        self.assertEqual(exc.exception.status_code, 404)
+        self.assertEqual(exc.exception.detail, "Contact not found")
+        self.async_session.commit.assert_not_awaited()
 
     async def test_repo_delete_contact_db_id_not_found(self):
         expected_contact = None
@@ -165,6 +223,19 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
                 or query.lower() in contact.email.lower()
             )
 
+    async def test_repo_get_contacts_query_uses_ilike(self):
+        async_result_mock = MagicMock()
+        async_result_mock.scalars.return_value.all.return_value = []
+        self.async_session.execute.return_value = async_result_mock
+
+        await repo_get_contacts_query(db=self.async_session, user=self.user, query="John", limit=10, offset=0)
+
+        stmt = str(self.async_session.execute.call_args.args[0].compile(dialect=postgresql.dialect()))
+        self.assertIn("contacts.first_name ILIKE", stmt)
+        self.assertIn("contacts.last_name ILIKE", stmt)
+        self.assertIn("contacts.email ILIKE", stmt)
+        self.assertNotIn("lower(", stmt)
+
     async def test_repo_get_upcoming_birthday_contacts(self):
         # Create contacts with upcoming birthdays
         contact_with_birthday_in_3_days = Contact(id=1, first_name="John", last_name="Doe", email="test@example.com",
@@ -187,13 +258,9 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
         expected_contacts = [contact_with_birthday_in_3_days, contact_with_birthday_in_5_days,
                              contact_with_birthday_in_1_day]
 
-        # Mock the result of the async execution
+        # Mock the result of the async execution (filtering by date happens in the database)
         async_result_mock = MagicMock()
-        async_result_mock.scalars.return_value.all.return_value = [contact_with_birthday_in_3_days,
-                                                                   contact_with_birthday_in_5_days,
-                                                                   contact_with_birthday_in_10_days,
-                                                                   contact_with_birthday_in_20_days,
-                                                                   contact_with_birthday_in_1_day]
+        async_result_mock.scalars.return_value.all.return_value = expected_contacts
         self.async_session.execute.return_value = async_result_mock
 
         # Test the function
@@ -202,6 +269,11 @@ class TestContactRepository(unittest.IsolatedAsyncioTestCase):
         # Verify the returned result
         self.assertEqual(result, expected_contacts)
 
+        # Verify that the birthday window is part of the SQL query
+        stmt = str(self.async_session.execute.call_args.args[0])
+        self.assertIn("EXTRACT(month FROM contacts.b_day)", stmt)
+        self.assertIn("EXTRACT(day FROM contacts.b_day)", stmt)
+
         # Additional checks: Verify the types and data returned
         self.assertIsInstance(result, list)
         for contact in result:
@@ -1,11 +1,11 @@
 import unittest
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 
 from sqlalchemy.ext.asyncio import AsyncSession
 from src.DB.models import Contact, User
 from src.repository.users_repo import repo_create_user, repo_user_authentication_by_email, repo_update_refresh_token, \
-    confirmed_email, update_avatar, add_reset_token_to_db
+    confirmed_email, update_avatar, add_reset_token_to_db, repo_get_user_by_email
 from src.schemas.User_Schemas import UserCreate
 from src.services.authservice import authservice as auth_service
 
@@ -37,6 +37,13 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(result, expected_user)
         self.assertTrue(email_to_find.lower() == expected_user.email.lower())
 
+    async def test_repo_get_user_by_email(self):
+        expected_user = self.user
+        self.async_session.execute.return_value.scalar.return_value = expected_user
+        result_coroutine = await repo_get_user_by_email(email=self.user.email, db=self.async_session)
+        result = await result_coroutine
+        self.assertEqual(result, expected_user)
+
     async def test_repo_update_refresh_token(self):
         refresh_token_ = await auth_service.create_refresh_token(data={"sub": self.user.email})
         self.assertNotEqual(self.user.refresh_token, refresh_token_)
@@ -46,26 +53,31 @@ class TestUserRepository(unittest.IsolatedAsyncioTestCase):
         self.assertEqual(self.user.refresh_token, refresh_token_)
 
     async def test_confirmed_email(self):
-        expected_user = self.user
-        self.assertFalse(self.user.is_activated, True)
-        with unittest.mock.patch('src.repository.users_repo.repo_user_authentication_by_email',
-                                 return_value=expected_user):
-            await confirmed_email(email=self.user.email, db=self.async_session)
-        self.assertTrue(self.user.is_activated, True)
+        await confirmed_email(email=self.user.email, db=self.async_session)
+        stmt = self.async_session.execute.call_args.args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.compile().params["is_activated"], True)
+        self.assertIn(self.user.email, stmt.compile().params.values())
+        self.async_session.commit.assert_awaited_once()
 
     async def test_update_avatar(self):
-        expected_user = self.user
         new_avatar = "https://avatar.com/example_avatar.jpg"
-        self.assertNotEqual(self.user.avatar, new_avatar)
-        with unittest.mock.patch('src.repository.users_repo.repo_user_authentication_by_email',
-                                 return_value=expected_user):
-            await update_avatar(email=self.user.email, src_url=new_avatar, db=self.async_session)
-        self.assertEqual(self.user.avatar, new_avatar)
+        updated_user = User(id=1, username="test_user", email=self.user.email, avatar=new_avatar)
+        async_result_mock = MagicMock()
+        async_result_mock.scalar_one.return_value = updated_user
+        self.async_session.execute.return_value = async_result_mock
+
+        result = await update_avatar(email=self.user.email, src_url=new_avatar, db=self.async_session)
+        stmt = self.async_session.execute.call_args.args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.compile().params["avatar"], new_avatar)
+        self.assertEqual(result.avatar, new_avatar)
+        self.async_session.commit.assert_awaited_once()
 
     async def test_add_reset_token_to_db(self):
         reset_token = auth_service.create_reset_token({"sub": self.user.email})
-        self.assertNotEqual(self.user.refresh_token, reset_token)
         await add_reset_token_to_db(user=self.user, reset_token=reset_token, db=self.async_session)
-        self.assertTrue(hasattr(self.user, "reset_token"))
-        self.assertEqual(self.user.reset_token, reset_token)
-
+        stmt = self.async_session.execute.call_args.args[0]
+        self.assertTrue(stmt.is_update)
+        self.assertEqual(stmt.compile().params["reset_token"], reset_token)
+        self.async_session.commit.assert_awaited_once()
@@ -0,0 +1,112 @@
+import hashlib
+import time
+import unittest
+from unittest.mock import AsyncMock, patch
+
+import jwt
+from fastapi import HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.DB.models import User
+from src.services.authservice import Auth, authservice as auth_service
+
+
+class TestAuthService(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        auth_service.verified_passwords.clear()
+        auth_service.token_cache.clear()
+        self.user = User(id=1, username="test_user", email="user@example.com", avatar="old.jpg")
+        self.async_session = AsyncMock(AsyncSession)
+
+    def test_check_password_hash_cache_hit_skips_verify(self):
+        with patch.object(Auth, "pwd_cxt") as pwd_cxt:
+            pwd_cxt.verify.return_value = True
+            self.assertTrue(auth_service.check_password_hash("hashed", "qwerty"))
+            self.assertTrue(auth_service.check_password_hash("hashed", "qwerty"))
+        pwd_cxt.verify.assert_called_once_with("qwerty", "hashed")
+
+    def test_check_password_hash_failure_is_not_cached(self):
+        with patch.object(Auth, "pwd_cxt") as pwd_cxt:
+            pwd_cxt.verify.return_value = False
+            self.assertFalse(auth_service.check_password_hash("hashed", "wrong"))
+            self.assertFalse(auth_service.check_password_hash("hashed", "wrong"))
+        self.assertEqual(pwd_cxt.verify.call_count, 2)
+        self.assertEqual(len(auth_service.verified_passwords), 0)
+
+    def test_check_password_hash_cache_key_is_not_plain_sha256(self):
+        with patch.object(Auth, "pwd_cxt") as pwd_cxt:
+            pwd_cxt.verify.return_value = True
+            auth_service.check_password_hash("hashed", "qwerty")
+        plain_key = hashlib.sha256(b"hashed:qwerty").digest()
+        self.assertNotIn(plain_key, auth_service.verified_passwords)
+        self.assertEqual(len(auth_service.verified_passwords), 1)
+
+    async def test_get_current_user_cache_hit_skips_decode(self):
+        token = await auth_service.create_access_token({"sub": self.user.email})
+        with patch("src.repository.users_repo.repo_user_authentication_by_email",
+                   return_value=self.user), \
+                patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+            first = await auth_service.get_current_user(token, self.async_session)
+            second = await auth_service.get_current_user(token, self.async_session)
+        self.assertEqual(first, self.user)
+        self.assertEqual(second, self.user)
+        decode.assert_called_once()
+        self.assertEqual(auth_service.token_cache[token][0], self.user.email)
+
+    async def test_get_current_user_expired_cache_entry_is_decoded_again(self):
+        token = await auth_service.create_access_token({"sub": self.user.email})
+        auth_service.token_cache[token] = ("stale@example.com", time.time() - 1)
+        with patch("src.repository.users_repo.repo_user_authentication_by_email",
+                   return_value=self.user) as repo, \
+                patch.object(jwt, "decode", wraps=jwt.decode) as decode:
+            result = await auth_service.get_current_user(token, self.async_session)
+        self.assertEqual(result, self.user)
+        decode.assert_called_once()
+        repo.assert_awaited_once_with(self.user.email, self.async_session)
+        self.assertGreater(auth_service.token_cache[token][1], time.time())
+
+    async def test_get_current_user_returns_fresh_user_on_cache_hit(self):
+        token = await auth_service.create_access_token({"sub": self.user.email})
+        updated_user = User(id=1, username="test_user", email=self.user.email, avatar="new.jpg")
+        with patch("src.repository.users_repo.repo_user_authentication_by_email",
+                   side_effect=[self.user, updated_user]):
+            await auth_service.get_current_user(token, self.async_session)
+            result = await auth_service.get_current_user(token, self.async_session)
+        self.assertEqual(result.avatar, "new.jpg")
+
+    async def test_get_current_user_deleted_user_is_rejected_on_cache_hit(self):
+        token = await auth_service.create_access_token({"sub": self.user.email})
+        with patch("src.repository.users_repo.repo_user_authentication_by_email",
+                   side_effect=[self.user, None]):
+            await auth_service.get_current_user(token, self.async_session)
+            with self.assertRaises(HTTPException) as exc:
+                await auth_service.get_current_user(token, self.async_session)
+        self.assertEqual(exc.exception.status_code, 401)
+
+    async def test_get_current_user_invalid_token_does_not_touch_db(self):
+        with self.assertRaises(HTTPException) as exc:
+            await auth_service.get_current_user("not.a.token", self.async_session)
+        self.assertEqual(exc.exception.status_code, 401)
+        self.async_session.connection.assert_not_called()
+        self.async_session.execute.assert_not_awaited()
+
+    async def test_get_current_user_expired_token_does_not_touch_db(self):
+        token = await auth_service.create_access_token({"sub": self.user.email}, expires_delta=-1)
+        with self.assertRaises(HTTPException) as exc:
+            await auth_service.get_current_user(token, self.async_session)
+        self.assertEqual(exc.exception.status_code, 401)
+        self.async_session.connection.assert_not_called()
+        self.async_session.execute.assert_not_awaited()
+
+    async def test_refresh_token_round_trip(self):
+        refresh_token = await auth_service.create_refresh_token({"sub": self.user.email})
+        email = await auth_service.decode_refresh_token(refresh_token)
+        self.assertEqual(email, self.user.email)
+
+    async def test_get_current_user_rejects_refresh_token(self):
+        refresh_token = await auth_service.create_refresh_token({"sub": self.user.email})
+        with patch("src.repository.users_repo.repo_user_authentication_by_email",
+                   return_value=self.user):
+            with self.assertRaises(HTTPException) as exc:
+                await auth_service.get_current_user(refresh_token, self.async_session)
+        self.assertEqual(exc.exception.status_code, 401)